@@ -14,9 +14,18 @@ Run:
 
 from __future__ import annotations
 import argparse
+import concurrent.futures
 import csv
-import itertools
+import fnmatch
+import hashlib
+import importlib
+import json
 import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
@@ -74,6 +83,52 @@ def find_output_picture_parm(rop: hou.Node) -> hou.Parm:
 def safe_mkdir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
+
+# Resolved parm names per (hip file, mtime, ROP path). The label searches
+# above walk every parm on the ROP; instead of re-running them each boot,
+# the first run emits a tiny specialized module under generated/ with the
+# names as literals, and later runs of the same hip just import it.
+_GENERATED_DIR = Path(__file__).resolve().parent / "generated"
+
+
+def parm_cache_key(hip_path: Path, rop_path: str) -> str:
+    return f"{hip_path}|{hip_path.stat().st_mtime_ns}|{rop_path}"
+
+
+def _hip_module_name(hip_path: Path, rop_path: str) -> str:
+    # mtime is part of the digest, so editing the hip naturally invalidates
+    # the module (the old one just goes stale on disk).
+    digest = hashlib.blake2b(parm_cache_key(hip_path, rop_path).encode(), digest_size=8).hexdigest()
+    return f"_hip_{digest}"
+
+
+def load_resolved_parms(hip_path: Path, rop_path: str) -> Optional[dict[str, Optional[str]]]:
+    try:
+        mod = importlib.import_module(f"generated.{_hip_module_name(hip_path, rop_path)}")
+    except ImportError:
+        return None
+    return {
+        "output_picture": mod.OUT_PICTURE,
+        "pixel_samples": getattr(mod, "PS_PARM", None),
+    }
+
+
+def save_resolved_parms(hip_path: Path, rop_path: str, out_picture: str, ps_parm: Optional[str]) -> None:
+    try:
+        _GENERATED_DIR.mkdir(parents=True, exist_ok=True)
+        (_GENERATED_DIR / "__init__.py").touch()
+        lines = [
+            f"# Auto-generated by render_sweep1.py for {hip_path.name} / {rop_path}.",
+            "# Parm names resolved once so later runs skip the label scans.",
+            f'OUT_PICTURE = "{out_picture}"',
+        ]
+        if ps_parm is not None:
+            lines.append(f'PS_PARM = "{ps_parm}"')
+        module_path = _GENERATED_DIR / f"{_hip_module_name(hip_path, rop_path)}.py"
+        module_path.write_text("\n".join(lines) + "\n")
+    except OSError:
+        pass  # read-only checkout etc.; specialization is best-effort
+
 def try_import_pillow():
     try:
         from PIL import Image  # type: ignore
@@ -81,6 +136,55 @@ def try_import_pillow():
     except Exception:
         return None
 
+def try_import_numpy():
+    try:
+        import numpy as np  # type: ignore
+        return np
+    except Exception:
+        return None
+
+def try_import_imageio():
+    try:
+        import imageio.v3 as iio  # type: ignore
+        return iio
+    except Exception:
+        try:
+            import imageio as iio  # type: ignore
+            return iio
+        except Exception:
+            return None
+
+def open_image(Image, path: Path):
+    """
+    Open a render output as a PIL image. PNGs go straight through Pillow;
+    EXRs (the --fast_output format) decode via OpenImageIO or imageio and
+    get clipped to 8-bit for thumbnailing.
+    """
+    if path.suffix.lower() != ".exr":
+        return Image.open(path)
+
+    np = try_import_numpy()
+    if np is None:
+        raise RuntimeError(f"Decoding EXR {path} for the contact sheet requires NumPy")
+
+    arr = None
+    try:
+        import OpenImageIO as oiio  # type: ignore
+        arr = oiio.ImageBuf(str(path)).get_pixels(oiio.UINT8)
+    except Exception:
+        iio = try_import_imageio()
+        if iio is not None:
+            arr = iio.imread(str(path))
+    if arr is None:
+        raise RuntimeError(f"Cannot decode EXR {path}: install OpenImageIO or imageio")
+
+    arr = np.asarray(arr)
+    if arr.dtype != np.uint8:
+        arr = np.clip(arr * 255.0, 0, 255).astype(np.uint8)
+    if arr.ndim == 3 and arr.shape[2] > 3:
+        arr = arr[:, :, :3]
+    return Image.fromarray(arr)
+
 
 # --------------------------- config ---------------------------
 
@@ -93,43 +197,148 @@ class SweepConfig:
     turntable_degrees: float
 
 
+@dataclass
+class SceneHandles:
+    """Nodes/parms resolved once after hip load, shared by sweep and serve modes."""
+    rop: hou.Node
+    mat: hou.Node
+    light: hou.Node
+    cam: hou.Node
+    rough_parm: hou.Parm
+    light_int_parm: hou.Parm
+    out_picture_parm: hou.Parm
+    ps_parm_name: Optional[str]
+    hip_path: Path
+
+
 # --------------------------- core logic ---------------------------
 
-def set_pixel_samples(rop: hou.Node, samples: int) -> str:
+def resolve_pixel_samples_parm(rop: hou.Node) -> Optional[str]:
     """
     Karma sample parm naming varies. We try a few common ones,
-    then fall back to label search.
+    then fall back to label search. Resolve once and reuse the name —
+    the label search walks every parm on the ROP.
     """
     candidates = ["pxsamples", "karma_pixelsamples", "pixel_samples", "pixelsamples", "samplesperpixel"]
     for c in candidates:
-        p = rop.parm(c)
-        if p is not None:
-            p.set(int(samples))
-            return p.name()
+        if rop.parm(c) is not None:
+            return c
 
     p = find_parm_by_label_contains(rop, ["pixel samples", "samples per pixel", "samples/pixel"])
     if p is not None:
-        p.set(int(samples))
         return p.name()
 
-    # Not fatal — log that we couldn't set it
-    return "<not_found>"
+    # Not fatal — caller logs that we couldn't set it
+    return None
+
+def pin_rop_reuse(rop: hou.Node) -> None:
+    """
+    Best-effort: ask Karma to reuse cooked scene state between renders so
+    a roughness-only change doesn't trigger a full USD stage re-compile.
+    The exact parm set varies across Karma versions, so each candidate is
+    applied only if it exists on this ROP.
+    """
+    candidates = {
+        "snapshotsharing": 1,
+        "husk_reuse_xforms": 1,
+    }
+    for name, value in candidates.items():
+        p = rop.parm(name)
+        if p is not None:
+            p.set(value)
+
 
-def rotate_camera_turntable(cam: hou.Node, frame_idx: int, total_frames: int, degrees: float) -> None:
+def bake_turntable(cam: hou.Node, total_frames: int, degrees: float) -> None:
     """
-    Simple turntable: rotate camera around Y axis by degrees over total_frames.
+    Bake the turntable as a keyframed ry channel: 0 degrees at frame 1,
+    `degrees` at the last frame, linear in between. Baking once lets the
+    ROP render the whole range in a single call instead of Python mutating
+    the camera (and forcing a re-cook) every frame.
     This assumes your camera is already positioned looking at the object.
     """
     if total_frames <= 1:
         return
-    frac = frame_idx / (total_frames - 1)
-    ry = frac * degrees
-
     ry_parm = cam.parm("ry")
     if ry_parm is None:
         # Some camera rigs might not expose ry at OBJ level; ignore silently
         return
-    ry_parm.set(float(ry))
+
+    ry_parm.deleteAllKeyframes()
+    for frame, value in ((1, 0.0), (total_frames, float(degrees))):
+        key = hou.Keyframe()
+        key.setFrame(frame)
+        key.setValue(value)
+        key.setExpression("linear()", hou.exprLanguage.Hscript)
+        ry_parm.setKeyframe(key)
+
+def render_cache_key(r: float, li: float, frame: int, ext: str) -> str:
+    """
+    Key for the on-disk render cache. Deliberately excludes pixel_samples:
+    the scene identity (shader, light, camera angle) is the same across the
+    spp axis, so an existing render for (r, li, frame) can stand in for the
+    other spp variants instead of invoking Karma again. The output
+    extension IS part of the key — a PNG run must never hardlink its bytes
+    into .exr names on a later --fast_output run, or vice versa.
+    """
+    return hashlib.blake2b(f"{r:.2f}|{li:.2f}|{frame}|{ext}".encode()).hexdigest()
+
+
+def load_render_cache(cache_path: Path, hip_mtime_ns: int) -> dict[str, str]:
+    if cache_path.exists():
+        try:
+            data = json.loads(cache_path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return {}  # corrupt/unreadable cache is not fatal; just re-render
+        # Cached frames are only valid for the hip version that rendered
+        # them: on an mtime mismatch (or a pre-fingerprint cache file) the
+        # whole cache is stale, same policy as the parm-name modules.
+        if isinstance(data, dict) and data.get("hip_mtime_ns") == hip_mtime_ns:
+            return data.get("entries", {})
+    return {}
+
+
+def save_render_cache(cache_path: Path, cache: dict[str, str], hip_mtime_ns: int) -> None:
+    cache_path.write_text(json.dumps({"hip_mtime_ns": hip_mtime_ns, "entries": cache}, indent=2))
+
+
+def hash_file(path: Path) -> str:
+    """Content hash for output dedupe; reads in 1 MiB chunks."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def dedupe_output(out_file: Path, seen: dict[str, Path]) -> bool:
+    """
+    If a byte-identical file was already written this sweep, replace
+    out_file with a hardlink to it — duplicate frames (e.g. converged
+    regions across the spp axis) then cost one link(2) instead of a second
+    copy of the pixels. Returns True if out_file became a link.
+    """
+    try:
+        digest = hash_file(out_file)
+    except OSError:
+        return False
+
+    original = seen.get(digest)
+    if original is None or original == out_file:
+        seen[digest] = out_file
+        return False
+
+    # Link to a temp name first so a failed link() never loses the file.
+    tmp = out_file.with_suffix(out_file.suffix + ".lnk")
+    try:
+        os.link(original, tmp)
+        os.replace(tmp, out_file)
+        return True
+    except OSError:
+        # Cross-device, or a filesystem without hardlinks: keep the copy
+        if tmp.exists():
+            tmp.unlink()
+        return False
+
 
 def render_one(
     rop: hou.Node,
@@ -139,31 +348,257 @@ def render_one(
     # Render exactly one frame
     rop.render(frame_range=(frame, frame))
 
+
+def load_scene(args) -> SceneHandles:
+    """Load the hip file and resolve all nodes/parms exactly once."""
+    proj_dir = Path(os.getcwd()).resolve()
+    hip_path = Path(args.hip).expanduser()
+    if not hip_path.is_absolute():
+        hip_path = (proj_dir / hip_path).resolve()
+
+    if not hip_path.exists():
+        raise RuntimeError(f"Hip file not found: {hip_path}")
+
+    print(f"Loading hip: {hip_path}")
+    hou.hipFile.load(str(hip_path))
+
+    rop = require_node(args.rop)
+    mat = require_node(args.mat)
+    light = require_node(args.light)
+    cam = require_node(args.cam)
+
+    rough_parm = require_parm(mat, args.rough_parm)
+
+    # Light intensity parm can vary; we try user-provided first, then search
+    light_int_parm = light.parm(args.light_int_parm)
+    if light_int_parm is None:
+        light_int_parm = find_parm_by_label_contains(light, ["intensity"])
+    if light_int_parm is None:
+        raise RuntimeError(
+            f"Could not find light intensity parm on {light.path()}.\n"
+            f"Try right-clicking the Intensity field -> Copy Parameter Name, then pass --light_int_parm <name>."
+        )
+
+    # Parm-name resolution, specialized per hip version: the first run on a
+    # given (hip, mtime, ROP) emits generated/_hip_<sha>.py with the names
+    # as literals, and repeat runs import it instead of scanning labels.
+    entry = load_resolved_parms(hip_path, rop.path()) or {}
+
+    out_picture_parm = None
+    cached_name = entry.get("output_picture")
+    if cached_name:
+        out_picture_parm = rop.parm(cached_name)
+    if out_picture_parm is None:
+        out_picture_parm = find_output_picture_parm(rop)
+
+    ps_parm_name = entry.get("pixel_samples")
+    if not ps_parm_name or rop.parm(ps_parm_name) is None:
+        ps_parm_name = resolve_pixel_samples_parm(rop)
+
+    if entry.get("output_picture") != out_picture_parm.name() or entry.get("pixel_samples") != ps_parm_name:
+        save_resolved_parms(hip_path, rop.path(), out_picture_parm.name(), ps_parm_name)
+
+    print(f"Output picture parm: {out_picture_parm.name()} (label: {out_picture_parm.description()})")
+
+    return SceneHandles(rop, mat, light, cam, rough_parm, light_int_parm, out_picture_parm, ps_parm_name, hip_path)
+
+
+def serve(args) -> int:
+    """
+    Daemon mode: load the hip once, then render one job per stdin line.
+
+    Each line is a JSON object like:
+      {"roughness": 0.3, "light_intensity": 2.5, "pixel_samples": 16,
+       "frame": 1, "out_file": "outputs/one_off.png"}
+
+    Hip load + scene compile are paid once per process instead of once per
+    run, which matters when sweeps are iterated interactively. Clients pipe
+    newline-delimited JSON in and read result lines back from stdout.
+    """
+    scene = load_scene(args)
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        job = json.loads(line)
+
+        scene.rough_parm.set(float(job["roughness"]))
+        scene.light_int_parm.set(float(job["light_intensity"]))
+        if scene.ps_parm_name is not None:
+            scene.rop.parm(scene.ps_parm_name).set(int(job["pixel_samples"]))
+        ps_parm_used = scene.ps_parm_name or "<not_found>"
+        scene.out_picture_parm.set(str(job["out_file"]))
+
+        frame = int(job.get("frame", 1))
+        t0 = time.time()
+        render_one(scene.rop, scene.out_picture_parm, frame)
+        dt = time.time() - t0
+
+        sys.stdout.write(json.dumps(dict(job, seconds=dt, ps_parm_used=ps_parm_used)) + "\n")
+        sys.stdout.flush()
+
+    return 0
+
+def find_images(root: Path, pattern: str) -> list[Path]:
+    """
+    Single-pass os.scandir walk standing in for Path.glob, which re-stats
+    every entry — noticeable once the sweep tree has hundreds of variation
+    subdirectories. A leading '**/' makes the match recursive; the rest is
+    an fnmatch pattern against the filename.
+    """
+    recursive = pattern.startswith("**/")
+    name_pattern = pattern[3:] if recursive else pattern
+
+    found: list[str] = []
+    stack = [str(root)]
+    while stack:
+        d = stack.pop()
+        try:
+            it = os.scandir(d)
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif fnmatch.fnmatch(entry.name, name_pattern):
+                    found.append(entry.path)
+    return [Path(p) for p in sorted(found)]
+
+
+def render_variation_to_video(
+    rop: hou.Node,
+    out_picture_name: str,
+    var_dir: Path,
+    total_frames: int,
+    framerate: int = 24,
+) -> Path:
+    """
+    Render a variation's turntable straight into an h264 file instead of
+    per-frame PNGs on disk. On POSIX, Karma writes each frame to a named
+    pipe and ffmpeg (-f image2pipe) encodes as frames arrive, so the PNGs
+    never touch the filesystem. Elsewhere, fall back to rendering into a
+    temporary directory and encoding once at the end.
+    """
+    video_path = var_dir / "turntable.mp4"
+
+    if os.name == "posix":
+        # The ROP picks the image format from the extension, so the fifo
+        # must look like a .png for Karma to select an encoder.
+        pipe_path = var_dir / "frames.png"
+        if pipe_path.exists():
+            pipe_path.unlink()
+        os.mkfifo(pipe_path)
+
+        proc = subprocess.Popen([
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-f", "image2pipe", "-framerate", str(framerate),
+            "-i", str(pipe_path),
+            "-c:v", "libx264", "-pix_fmt", "yuv420p", str(video_path),
+        ])
+        # Hold a write end open ourselves: Karma opens/closes the fifo per
+        # frame, and without this ffmpeg would see EOF after the first frame.
+        keep_open = os.open(str(pipe_path), os.O_RDWR)
+        render_done = threading.Event()
+
+        def _drain_if_ffmpeg_dies() -> None:
+            # Our O_RDWR fd keeps the fifo writable even after ffmpeg's
+            # read end closes, so a mid-encode death (ENOSPC, codec error)
+            # would leave Karma blocked on a full pipe buffer. Swallow the
+            # remaining frames instead, so the render returns and the
+            # returncode check below can raise.
+            proc.wait()
+            if render_done.is_set():
+                return
+            try:
+                fd = os.open(str(pipe_path), os.O_RDONLY | os.O_NONBLOCK)
+            except OSError:
+                return
+            try:
+                while not render_done.wait(0.05):
+                    try:
+                        while os.read(fd, 1 << 16):
+                            pass
+                    except OSError:
+                        pass  # empty pipe; poll again
+            finally:
+                os.close(fd)
+
+        monitor = threading.Thread(target=_drain_if_ffmpeg_dies, daemon=True)
+        monitor.start()
+        try:
+            rop.setParms({out_picture_name: str(pipe_path)})
+            rop.render(frame_range=(1, total_frames))
+        finally:
+            render_done.set()
+            os.close(keep_open)
+            returncode = proc.wait()
+            monitor.join()
+            pipe_path.unlink()
+        if returncode != 0:
+            raise RuntimeError(f"ffmpeg exited with status {returncode} while encoding {video_path}")
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            rop.setParms({out_picture_name: str(Path(tmp) / "frame_$F4.png")})
+            rop.render(frame_range=(1, total_frames))
+            subprocess.run([
+                "ffmpeg", "-y", "-loglevel", "error",
+                "-framerate", str(framerate),
+                "-i", str(Path(tmp) / "frame_%04d.png"),
+                "-c:v", "libx264", "-pix_fmt", "yuv420p", str(video_path),
+            ], check=True)
+
+    return video_path
+
+
 def build_contact_sheet(outputs_dir: Path, glob_pattern: str = "*.png", cols: int = 5) -> Optional[Path]:
     Image = try_import_pillow()
     if Image is None:
         return None
 
-    images = sorted(outputs_dir.glob(glob_pattern))
+    images = find_images(outputs_dir, glob_pattern)
     if not images:
         return None
 
-    thumbs = []
-    for p in images:
-        im = Image.open(p).convert("RGB")
-        im.thumbnail((480, 480))
-        thumbs.append((p.name, im))
-
-    # Grid size
-    rows = (len(thumbs) + cols - 1) // cols
-    w = max(t[1].size[0] for t in thumbs)
-    h = max(t[1].size[1] for t in thumbs)
-
-    sheet = Image.new("RGB", (cols * w, rows * h))
-    for i, (_, im) in enumerate(thumbs):
-        x = (i % cols) * w
-        y = (i // cols) * h
-        sheet.paste(im, (x, y))
+    # Every sweep frame comes from the same camera, so a single cell size
+    # (first image scaled to fit 480px) works for the whole grid.
+    first = open_image(Image, images[0])
+    scale = min(480 / first.width, 480 / first.height, 1.0)
+    cell_w = max(1, round(first.width * scale))
+    cell_h = max(1, round(first.height * scale))
+
+    rows = (len(images) + cols - 1) // cols
+
+    # Disk read + PNG decode dominate here and PIL releases the GIL while
+    # decoding, so a thread pool scales the decode step with core count.
+    def _decode_cell(p: Path):
+        return open_image(Image, p).convert("RGB").resize((cell_w, cell_h), Image.BILINEAR)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        thumbs = list(ex.map(_decode_cell, images))
+
+    np = try_import_numpy()
+    if np is not None:
+        # Stack thumbnails into one (N, h, w, 3) block and let a single
+        # reshape/transpose build the grid in C instead of N paste() calls.
+        arrs = [np.asarray(im) for im in thumbs]
+        pad = rows * cols - len(arrs)
+        if pad:
+            arrs.extend([np.zeros((cell_h, cell_w, 3), dtype=np.uint8)] * pad)
+        grid = (
+            np.stack(arrs)
+            .reshape(rows, cols, cell_h, cell_w, 3)
+            .transpose(0, 2, 1, 3, 4)
+            .reshape(rows * cell_h, cols * cell_w, 3)
+        )
+        sheet = Image.fromarray(grid)
+    else:
+        # NumPy not available: paste one by one as before
+        sheet = Image.new("RGB", (cols * cell_w, rows * cell_h))
+        for i, im in enumerate(thumbs):
+            sheet.paste(im, ((i % cols) * cell_w, (i // cols) * cell_h))
 
     out_path = outputs_dir / "contact_sheet.png"
     sheet.save(out_path)
@@ -181,43 +616,37 @@ def main() -> int:
     ap.add_argument("--cam", default="/obj/render_cam", help="Camera node path for optional turntable")
     ap.add_argument("--outdir", default="outputs", help="Output directory")
     ap.add_argument("--make_contact_sheet", action="store_true", help="Build contact sheet (requires Pillow)")
+    ap.add_argument("--video-out", action="store_true", dest="video_out",
+                    help="Encode each turntable straight to h264 via ffmpeg instead of writing PNGs")
+    ap.add_argument("--fast_output", action="store_true",
+                    help="Write frames as EXR (cheap encode, half-float) instead of PNG deflate")
+    ap.add_argument("--serve", action="store_true",
+                    help="Keep the process alive and render JSON jobs from stdin")
     args = ap.parse_args()
 
-    proj_dir = Path(os.getcwd()).resolve()
-    hip_path = Path(args.hip).expanduser()
-    if not hip_path.is_absolute():
-        hip_path = (proj_dir / hip_path).resolve()
-
-    if not hip_path.exists():
-        raise RuntimeError(f"Hip file not found: {hip_path}")
+    if args.serve:
+        return serve(args)
 
+    proj_dir = Path(os.getcwd()).resolve()
     outdir = Path(args.outdir)
     if not outdir.is_absolute():
         outdir = (proj_dir / outdir).resolve()
     safe_mkdir(outdir)
 
-    print(f"Loading hip: {hip_path}")
-    hou.hipFile.load(str(hip_path))
-
-    rop = require_node(args.rop)
-    mat = require_node(args.mat)
-    light = require_node(args.light)
-    cam = require_node(args.cam)
-
-    rough_parm = require_parm(mat, args.rough_parm)
-
-    # Light intensity parm can vary; we try user-provided first, then search
-    light_int_parm = light.parm(args.light_int_parm)
-    if light_int_parm is None:
-        light_int_parm = find_parm_by_label_contains(light, ["intensity"])
-    if light_int_parm is None:
-        raise RuntimeError(
-            f"Could not find light intensity parm on {light.path()}.\n"
-            f"Try right-clicking the Intensity field -> Copy Parameter Name, then pass --light_int_parm <name>."
-        )
-
-    out_picture_parm = find_output_picture_parm(rop)
-    print(f"Output picture parm: {out_picture_parm.name()} (label: {out_picture_parm.description()})")
+    scene = load_scene(args)
+    rop = scene.rop
+    mat = scene.mat
+    light = scene.light
+    cam = scene.cam
+    out_picture_parm = scene.out_picture_parm
+
+    # Resolve parm names once; the loop below then does one setParms() dict
+    # call per node instead of a hou.Parm.set() round trip per parm (and no
+    # per-combo label scan for the pixel-samples parm).
+    light_int_name = scene.light_int_parm.name()
+    out_picture_name = out_picture_parm.name()
+    ps_parm_name = scene.ps_parm_name
+    ps_parm_used = ps_parm_name if ps_parm_name is not None else "<not_found>"
 
     # ----- the “complex” sweep setup -----
     cfg = SweepConfig(
@@ -228,47 +657,155 @@ def main() -> int:
         turntable_degrees=360.0,
     )
 
-    # metadata log
-    csv_path = outdir / "render_log.csv"
-    with open(csv_path, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            "roughness", "light_intensity", "pixel_samples",
-            "frame", "output_file", "pixel_samples_parm_used", "seconds"
-        ])
+    # Cache of finished renders keyed on (r, li, frame); lets us reuse an
+    # existing frame across the pixel_samples axis instead of re-rendering.
+    # Fingerprinted on the hip mtime so an edited scene drops the cache.
+    cache_path = outdir / ".render_cache.json"
+    hip_mtime_ns = scene.hip_path.stat().st_mtime_ns
+    render_cache = load_render_cache(cache_path, hip_mtime_ns)
 
-        combos = list(itertools.product(cfg.roughness, cfg.light_intensity, cfg.pixel_samples))
-        print(f"Total variations: {len(combos)}; frames per variation: {cfg.turntable_frames}")
-
-        for (r, li, ps) in combos:
-            rough_parm.set(float(r))
-            light_int_parm.set(float(li))
-            ps_parm_used = set_pixel_samples(rop, int(ps))
-
-            # Folder per variation (production style)
-            var_dir = outdir / f"rough_{r:.2f}" / f"light_{li:.2f}" / f"spp_{ps:03d}"
-            safe_mkdir(var_dir)
-
-            for frame_idx in range(cfg.turntable_frames):
-                frame = 1 + frame_idx
-                rotate_camera_turntable(cam, frame_idx, cfg.turntable_frames, cfg.turntable_degrees)
-
-                out_file = var_dir / f"frame_{frame:04d}.png"
-                out_picture_parm.set(str(out_file))
-
-                t0 = time.time()
-                render_one(rop, out_picture_parm, frame)
-                dt = time.time() - t0
-
-                writer.writerow([f"{r:.2f}", f"{li:.2f}", ps, frame, str(out_file), ps_parm_used, f"{dt:.3f}"])
-                print(f"Rendered r={r:.2f}, li={li:.2f}, spp={ps}, frame={frame:04d} -> {out_file.name} ({dt:.2f}s)")
+    # metadata log: rows buffer in memory and flush once at the end, so the
+    # hot loop never does small interleaved file writes. The finally block
+    # means a Ctrl-C mid-sweep still leaves a usable partial log.
+    csv_path = outdir / "render_log.csv"
+    csv_header = [
+        "roughness", "light_intensity", "pixel_samples",
+        "frame", "output_file", "pixel_samples_parm_used", "seconds", "cached"
+    ]
+    rows: list[list] = []
+    try:
+        total = len(cfg.roughness) * len(cfg.light_intensity) * len(cfg.pixel_samples)
+        print(f"Total variations: {total}; frames per variation: {cfg.turntable_frames}")
+
+        # Bake the turntable once; every variation renders the same camera move.
+        bake_turntable(cam, cfg.turntable_frames, cfg.turntable_degrees)
+        frames = list(range(1, cfg.turntable_frames + 1))
+
+        # Pin reusable Karma state and force one up-front cook, so the
+        # renders in the loop only pay for the parms we actually dirty.
+        pin_rop_reuse(rop)
+        hou.hscript("opcook -F " + rop.path())
+
+        # Per-frame filenames are identical for every variation; format once.
+        # Karma picks the file format from the extension, so --fast_output
+        # only has to swap the suffix: EXR skips PNG's zlib deflate entirely.
+        ext = ".exr" if args.fast_output else ".png"
+        frame_names = {f: f"frame_{f:04d}{ext}" for f in frames}
+
+        # Content hash -> first file written with those bytes, for hardlink
+        # dedupe of identical frames.
+        seen_hashes: dict[str, Path] = {}
+        last_out_template: Optional[str] = None
+
+        # Create the whole variation tree up front; mkdir(parents=True)
+        # stats/creates up to three levels per call, so doing it once here
+        # keeps those syscalls out of the render loop.
+        for r in cfg.roughness:
+            for li in cfg.light_intensity:
+                for ps in cfg.pixel_samples:
+                    (outdir / f"rough_{r:.2f}" / f"light_{li:.2f}" / f"spp_{ps:03d}").mkdir(parents=True, exist_ok=True)
+
+        # Nested loops, roughness outermost (slowest-varying): a roughness
+        # change dirties the shader and is the most expensive axis to touch,
+        # while pixel samples (innermost) is the cheapest. Each parm write
+        # and each path/format piece happens at the level it belongs to.
+        for r in cfg.roughness:
+            r_str = f"{r:.2f}"
+            r_dir = outdir / f"rough_{r_str}"
+            mat.setParms({args.rough_parm: float(r)})
+
+            for li in cfg.light_intensity:
+                li_str = f"{li:.2f}"
+                li_dir = r_dir / f"light_{li_str}"
+                light.setParms({light_int_name: float(li)})
+
+                cache_keys = {f: render_cache_key(r, li, f, ext) for f in frames}
+
+                for ps in cfg.pixel_samples:
+                    if ps_parm_name is not None:
+                        rop.setParms({ps_parm_name: int(ps)})
+
+                    # Folder per variation (production style), created up front
+                    var_dir = li_dir / f"spp_{ps:03d}"
+
+                    if args.video_out:
+                        # Frames stream through a pipe into ffmpeg; no PNGs hit
+                        # disk, so the per-frame cache doesn't apply here.
+                        t0 = time.perf_counter_ns()
+                        video_path = render_variation_to_video(rop, out_picture_name, var_dir, cfg.turntable_frames)
+                        dt_ns = time.perf_counter_ns() - t0
+                        rows.append([r_str, li_str, ps, "all", str(video_path), ps_parm_used, dt_ns, False])
+                        print(f"Encoded  r={r_str}, li={li_str}, spp={ps} -> {video_path.name} ({dt_ns / 1e9:.2f}s)")
+                        continue
+
+                    cached_srcs = {f: render_cache.get(cache_keys[f]) for f in frames}
+                    if all(src and Path(src).exists() for src in cached_srcs.values()):
+                        for frame in frames:
+                            out_file = var_dir / frame_names[frame]
+                            if str(out_file) != cached_srcs[frame]:
+                                # Cache hits are byte-identical by definition;
+                                # prefer a hardlink over a second copy.
+                                try:
+                                    if out_file.exists():
+                                        out_file.unlink()
+                                    os.link(cached_srcs[frame], out_file)
+                                except OSError:
+                                    shutil.copyfile(cached_srcs[frame], out_file)
+                            rows.append([r_str, li_str, ps, frame, str(out_file), ps_parm_used, 0, True])
+                        print(f"Reused   r={r_str}, li={li_str}, spp={ps}: all {len(frames)} frames (cached)")
+                        continue
+
+                    # One $F4-templated render call covers the whole turntable,
+                    # so Karma amortizes scene prep across the range. Only
+                    # write the parm when the template actually changes —
+                    # re-setting an identical value still dirties the ROP.
+                    out_template = str(var_dir / f"frame_$F4{ext}")
+                    if out_template != last_out_template:
+                        rop.setParms({out_picture_name: out_template})
+                        last_out_template = out_template
+
+                    # perf_counter_ns is monotonic (immune to NTP jumps) for
+                    # the render duration; the wall-clock stamp only anchors
+                    # the mtime-based per-frame split below.
+                    t0_wall = time.time()
+                    t0 = time.perf_counter_ns()
+                    rop.render(frame_range=(1, cfg.turntable_frames))
+                    dt_ns = time.perf_counter_ns() - t0
+
+                    # Frames are written sequentially, so mtime deltas
+                    # approximate per-frame cost well enough for the log.
+                    prev = t0_wall
+                    for frame in frames:
+                        out_file = var_dir / frame_names[frame]
+                        try:
+                            mtime = out_file.stat().st_mtime
+                            frame_dt_ns = max(int((mtime - prev) * 1e9), 0)
+                            prev = mtime
+                        except OSError:
+                            frame_dt_ns = dt_ns // len(frames)
+                        render_cache[cache_keys[frame]] = str(out_file)
+                        dedupe_output(out_file, seen_hashes)
+                        rows.append([r_str, li_str, ps, frame, str(out_file), ps_parm_used, frame_dt_ns, False])
+
+                    print(f"Rendered r={r_str}, li={li_str}, spp={ps}: frames 1-{cfg.turntable_frames} ({dt_ns / 1e9:.2f}s)")
+    finally:
+        # The seconds column buffers as raw nanoseconds; format once here
+        # instead of per row in the hot loop.
+        for row in rows:
+            row[6] = f"{row[6] / 1e9:.3f}"
+        with open(csv_path, "w", newline="", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(csv_header)
+            writer.writerows(rows)
+        save_render_cache(cache_path, render_cache, hip_mtime_ns)
 
     print(f"Saved render log: {csv_path}")
 
     # Optional: build a quick contact sheet for the top-level outputs folder only.
     # (This is most useful if you render stills; for turntables it will pick many frames.)
     if args.make_contact_sheet:
-        sheet = build_contact_sheet(outdir, glob_pattern="**/frame_0001.png", cols=6)
+        ext = ".exr" if args.fast_output else ".png"
+        sheet = build_contact_sheet(outdir, glob_pattern=f"**/frame_0001{ext}", cols=6)
         if sheet:
             print(f"Contact sheet created: {sheet}")
         else:
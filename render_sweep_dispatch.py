@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Multi-worker sweep driver (plain Python, no hou import):
+- Expands the (roughness, light_intensity, pixel_samples, frame) product into jobs
+- Shards jobs across N hython worker subprocesses (one per GPU/CPU slot)
+- Pins each worker to a GPU via CUDA_VISIBLE_DEVICES
+- Collects results through a queue and writes one render_log.csv
+
+Karma renders dominate runtime, so wall time drops roughly linearly with
+worker count (license seats permitting).
+
+Run:
+  python render_sweep_dispatch.py --hip scene.hipnc --num-gpus 2 --workers-per-gpu 1
+"""
+
+from __future__ import annotations
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing as mp
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+WORKER_SCRIPT = Path(__file__).resolve().parent / "render_sweep_worker.py"
+
+# Sweep values (mirrors the SweepConfig defaults in render_sweep1.py)
+ROUGHNESS = (0.1, 0.3, 0.5, 0.7, 0.9)
+LIGHT_INTENSITY = (1.5, 2.5, 3.5)
+PIXEL_SAMPLES = (16, 32)
+TURNTABLE_FRAMES = 12
+TURNTABLE_DEGREES = 360.0
+
+CSV_HEADER = [
+    "roughness", "light_intensity", "pixel_samples",
+    "frame", "output_file", "pixel_samples_parm_used", "seconds",
+]
+
+
+def build_jobs(outdir: Path) -> list[dict]:
+    jobs = []
+    combos = itertools.product(ROUGHNESS, LIGHT_INTENSITY, PIXEL_SAMPLES)
+    for (r, li, ps) in combos:
+        var_dir = outdir / f"rough_{r:.2f}" / f"light_{li:.2f}" / f"spp_{ps:03d}"
+        var_dir.mkdir(parents=True, exist_ok=True)
+        for frame_idx in range(TURNTABLE_FRAMES):
+            frame = 1 + frame_idx
+            ry = 0.0
+            if TURNTABLE_FRAMES > 1:
+                ry = frame_idx / (TURNTABLE_FRAMES - 1) * TURNTABLE_DEGREES
+            jobs.append({
+                "roughness": r,
+                "light_intensity": li,
+                "pixel_samples": ps,
+                "frame": frame,
+                "camera_ry": ry,
+                "out_file": str(var_dir / f"frame_{frame:04d}.png"),
+            })
+    return jobs
+
+
+def worker(jobs: mp.JoinableQueue, results: mp.Queue, gpu: int, hython: str,
+           worker_args: list[str]) -> None:
+    """Pull jobs off the queue and feed them to one persistent hython child.
+
+    The child loads the hip file once, so hip load + scene compile is paid
+    once per worker instead of once per variation.
+    """
+    env = dict(os.environ, CUDA_VISIBLE_DEVICES=str(gpu))
+    proc = subprocess.Popen(
+        [hython, str(WORKER_SCRIPT)] + worker_args,
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, env=env,
+    )
+    try:
+        while True:
+            job = jobs.get()
+            if job is None:
+                jobs.task_done()
+                break
+            try:
+                proc.stdin.write(json.dumps(job) + "\n")
+                proc.stdin.flush()
+                reply = proc.stdout.readline()
+                if not reply:
+                    raise RuntimeError(f"hython worker on GPU {gpu} exited unexpectedly")
+                results.put(json.loads(reply))
+            finally:
+                # Account for the pulled job even when the child crashed:
+                # a missed task_done() would deadlock jobs.join() in main.
+                jobs.task_done()
+    finally:
+        proc.stdin.close()
+        proc.wait()
+
+
+def logger(results: mp.Queue, csv_path: Path, counter: mp.Value, total: int) -> None:
+    """Single consumer for the results queue; the only process touching the CSV."""
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+        while True:
+            row = results.get()
+            if row is None:
+                break
+            writer.writerow([
+                f"{row['roughness']:.2f}", f"{row['light_intensity']:.2f}",
+                row["pixel_samples"], row["frame"], row["out_file"],
+                row["ps_parm_used"], f"{row['seconds']:.3f}",
+            ])
+            with counter.get_lock():
+                counter.value += 1
+                done = counter.value
+            print(f"[{done}/{total}] {Path(row['out_file']).name} ({row['seconds']:.2f}s)")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--hip", default="scene.hipnc", help="Hip file name/path")
+    ap.add_argument("--rop", default="/out/karma1", help="Karma ROP path")
+    ap.add_argument("--mat", default="/mat/test_material", help="Material node path")
+    ap.add_argument("--rough_parm", default="rough", help="Roughness parm name")
+    ap.add_argument("--light", default="/obj/env_light", help="Light node path")
+    ap.add_argument("--light_int_parm", default="light_intensity", help="Light intensity parm name")
+    ap.add_argument("--cam", default="/obj/render_cam", help="Camera node path")
+    ap.add_argument("--outdir", default="outputs", help="Output directory")
+    ap.add_argument("--hython", default="hython", help="hython executable to spawn workers with")
+    ap.add_argument("--num-gpus", type=int, default=1, help="Number of GPUs to shard across")
+    ap.add_argument("--workers-per-gpu", type=int, default=1, help="Workers per GPU")
+    args = ap.parse_args()
+
+    outdir = Path(args.outdir)
+    if not outdir.is_absolute():
+        outdir = (Path(os.getcwd()) / outdir).resolve()
+    outdir.mkdir(parents=True, exist_ok=True)
+
+    worker_args = [
+        "--hip", args.hip, "--rop", args.rop,
+        "--mat", args.mat, "--rough_parm", args.rough_parm,
+        "--light", args.light, "--light_int_parm", args.light_int_parm,
+        "--cam", args.cam,
+    ]
+
+    job_list = build_jobs(outdir)
+    n_workers = args.num_gpus * args.workers_per_gpu
+    print(f"Total jobs: {len(job_list)}; workers: {n_workers}")
+
+    jobs: mp.JoinableQueue = mp.JoinableQueue()
+    results: mp.Queue = mp.Queue()
+    counter = mp.Value("i", 0)
+
+    for job in job_list:
+        jobs.put(job)
+
+    log_proc = mp.Process(
+        target=logger, args=(results, outdir / "render_log.csv", counter, len(job_list))
+    )
+    log_proc.start()
+
+    procs = []
+    for i in range(n_workers):
+        gpu = i % args.num_gpus
+        p = mp.Process(target=worker, args=(jobs, results, gpu, args.hython, worker_args))
+        p.start()
+        procs.append(p)
+
+    # Wait for the queue to drain, but keep watching the workers: a bare
+    # jobs.join() would block forever if they all died.
+    drained = threading.Event()
+
+    def _wait_drained() -> None:
+        jobs.join()
+        drained.set()
+
+    threading.Thread(target=_wait_drained, daemon=True).start()
+    while not drained.wait(timeout=1.0):
+        dead = [p for p in procs if p.exitcode not in (None, 0)]
+        if dead:
+            for p in procs:
+                p.terminate()
+            results.put(None)
+            log_proc.join()
+            # The queues still hold undrained items; without this the
+            # interpreter's atexit handler joins their feeder threads,
+            # which block on full pipes nobody will ever read.
+            jobs.cancel_join_thread()
+            results.cancel_join_thread()
+            raise RuntimeError(f"{len(dead)} render worker(s) exited abnormally; aborting sweep")
+
+    for _ in procs:
+        jobs.put(None)
+    for p in procs:
+        p.join()
+
+    results.put(None)
+    log_proc.join()
+
+    failed = [p for p in procs if p.exitcode != 0]
+    if failed:
+        raise RuntimeError(f"{len(failed)} render worker(s) exited abnormally")
+
+    print(f"Done. Outputs in: {outdir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env hython
+"""
+Sweep driver built on concurrent.futures.ProcessPoolExecutor:
+- The pool initializer runs once per worker process, loading the hip file
+  and resolving parms into module globals (a preloaded hython kernel)
+- Each task is then just parm sets + a single-frame render
+- The driver writes render_log.csv rows in order of completion
+
+Compared to render_sweep_dispatch.py this keeps everything in one script
+and one process tree — no stdin/stdout job protocol — at the cost of
+requiring the driver itself to run under hython.
+
+Size --workers to what your license manager can actually serve; each
+worker holds its own Karma session.
+
+Run:
+  hython render_sweep_pool.py --hip scene.hipnc --workers 2
+"""
+
+from __future__ import annotations
+import argparse
+import concurrent.futures
+import csv
+import os
+import time
+from pathlib import Path
+
+from render_sweep_dispatch import CSV_HEADER, build_jobs
+
+# Per-worker scene handles, populated by _init_worker after the fork/spawn.
+_SCENE = None
+
+
+def _init_worker(scene_args: dict) -> None:
+    global _SCENE
+    import render_sweep1
+    _SCENE = render_sweep1.load_scene(argparse.Namespace(**scene_args))
+
+
+def _render_task(job: dict) -> dict:
+    scene = _SCENE
+    scene.rough_parm.set(float(job["roughness"]))
+    scene.light_int_parm.set(float(job["light_intensity"]))
+    if scene.ps_parm_name is not None:
+        scene.rop.parm(scene.ps_parm_name).set(int(job["pixel_samples"]))
+
+    ry_parm = scene.cam.parm("ry")
+    if ry_parm is not None and "camera_ry" in job:
+        # A previous run may have baked turntable keys; a plain set would
+        # be shadowed by the channel, so clear it first.
+        ry_parm.deleteAllKeyframes()
+        ry_parm.set(float(job["camera_ry"]))
+
+    scene.out_picture_parm.set(str(job["out_file"]))
+
+    frame = int(job["frame"])
+    t0 = time.perf_counter_ns()
+    scene.rop.render(frame_range=(frame, frame))
+    dt_ns = time.perf_counter_ns() - t0
+
+    return dict(job, seconds=dt_ns / 1e9,
+                ps_parm_used=scene.ps_parm_name or "<not_found>")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--hip", default="scene.hipnc", help="Hip file name/path")
+    ap.add_argument("--rop", default="/out/karma1", help="Karma ROP path")
+    ap.add_argument("--mat", default="/mat/test_material", help="Material node path")
+    ap.add_argument("--rough_parm", default="rough", help="Roughness parm name")
+    ap.add_argument("--light", default="/obj/env_light", help="Light node path")
+    ap.add_argument("--light_int_parm", default="light_intensity", help="Light intensity parm name")
+    ap.add_argument("--cam", default="/obj/render_cam", help="Camera node path")
+    ap.add_argument("--outdir", default="outputs", help="Output directory")
+    ap.add_argument("--workers", type=int, default=2,
+                    help="Worker processes (match your Karma license seats)")
+    args = ap.parse_args()
+
+    outdir = Path(args.outdir)
+    if not outdir.is_absolute():
+        outdir = (Path(os.getcwd()) / outdir).resolve()
+    outdir.mkdir(parents=True, exist_ok=True)
+
+    scene_args = {
+        "hip": args.hip, "rop": args.rop,
+        "mat": args.mat, "rough_parm": args.rough_parm,
+        "light": args.light, "light_int_parm": args.light_int_parm,
+        "cam": args.cam,
+    }
+
+    jobs = build_jobs(outdir)
+    print(f"Total jobs: {len(jobs)}; workers: {args.workers}")
+
+    csv_path = outdir / "render_log.csv"
+    done = 0
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=args.workers,
+            initializer=_init_worker,
+            initargs=(scene_args,),
+        ) as executor:
+            futures = [executor.submit(_render_task, job) for job in jobs]
+            for future in concurrent.futures.as_completed(futures):
+                row = future.result()
+                writer.writerow([
+                    f"{row['roughness']:.2f}", f"{row['light_intensity']:.2f}",
+                    row["pixel_samples"], row["frame"], row["out_file"],
+                    row["ps_parm_used"], f"{row['seconds']:.3f}",
+                ])
+                done += 1
+                print(f"[{done}/{len(jobs)}] {Path(row['out_file']).name} ({row['seconds']:.2f}s)")
+
+    print(f"Saved render log: {csv_path}")
+    print(f"Done. Outputs in: {outdir}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
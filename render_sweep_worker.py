@@ -0,0 +1,98 @@
+#!/usr/bin/env hython
+"""
+Persistent hython render worker for render_sweep_dispatch.py:
+- Loads the hip file once
+- Reads newline-delimited JSON jobs from stdin
+- Renders each job and replies with a JSON result line on stdout
+
+A job looks like:
+  {"roughness": 0.3, "light_intensity": 2.5, "pixel_samples": 16,
+   "frame": 4, "camera_ry": 98.18, "out_file": ".../frame_0004.png"}
+
+Run (normally spawned by the dispatcher, one per GPU/CPU slot):
+  hython render_sweep_worker.py --hip scene.hipnc --rop /out/karma1 \
+      --mat /mat/test_material --light /obj/env_light
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import hou
+
+from render_sweep1 import (
+    require_node,
+    require_parm,
+    find_parm_by_label_contains,
+    find_output_picture_parm,
+    resolve_pixel_samples_parm,
+)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--hip", default="scene.hipnc", help="Hip file name/path")
+    ap.add_argument("--rop", default="/out/karma1", help="Karma ROP path")
+    ap.add_argument("--mat", default="/mat/test_material", help="Material node path")
+    ap.add_argument("--rough_parm", default="rough", help="Roughness parm name")
+    ap.add_argument("--light", default="/obj/env_light", help="Light node path")
+    ap.add_argument("--light_int_parm", default="light_intensity", help="Light intensity parm name")
+    ap.add_argument("--cam", default="/obj/render_cam", help="Camera node path")
+    args = ap.parse_args()
+
+    hip_path = Path(args.hip).expanduser().resolve()
+    if not hip_path.exists():
+        raise RuntimeError(f"Hip file not found: {hip_path}")
+    hou.hipFile.load(str(hip_path))
+
+    rop = require_node(args.rop)
+    mat = require_node(args.mat)
+    light = require_node(args.light)
+    cam = require_node(args.cam)
+
+    rough_parm = require_parm(mat, args.rough_parm)
+    light_int_parm = light.parm(args.light_int_parm)
+    if light_int_parm is None:
+        light_int_parm = find_parm_by_label_contains(light, ["intensity"])
+    if light_int_parm is None:
+        raise RuntimeError(f"Could not find light intensity parm on {light.path()}")
+    out_picture_parm = find_output_picture_parm(rop)
+    ry_parm = cam.parm("ry")
+
+    # Resolve the samples parm name once; per job it's then a plain set()
+    # instead of re-running the candidate probe / label scan.
+    ps_parm_name = resolve_pixel_samples_parm(rop)
+    ps_parm_used = ps_parm_name if ps_parm_name is not None else "<not_found>"
+
+    # Drain jobs until stdin closes (dispatcher closed the pipe).
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        job = json.loads(line)
+
+        rough_parm.set(float(job["roughness"]))
+        light_int_parm.set(float(job["light_intensity"]))
+        if ps_parm_name is not None:
+            rop.parm(ps_parm_name).set(int(job["pixel_samples"]))
+        if ry_parm is not None and "camera_ry" in job:
+            ry_parm.set(float(job["camera_ry"]))
+        out_picture_parm.set(str(job["out_file"]))
+
+        frame = int(job["frame"])
+        t0 = time.time()
+        rop.render(frame_range=(frame, frame))
+        dt = time.time() - t0
+
+        reply = dict(job, seconds=dt, ps_parm_used=ps_parm_used)
+        sys.stdout.write(json.dumps(reply) + "\n")
+        sys.stdout.flush()
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())